@@ -11,6 +11,7 @@ from ..project.paths import ensure_dirs, Project, recursive_update, create_model
 from .methods import (
     fit_types,
     fit,
+    fit_status,
     prepare_dataset,
 )
 from ..io.loaders import load_dataset
@@ -22,7 +23,6 @@ from ..logging import ArrayTrace
 from ..models.joint import JointModelParams, JointModel
 from ..models.instantiation import get_model
 from ..models.util import (
-    apply_bodies,
     reconst_errs,
     induced_reference_keypoints,
     _optional_pbar,
@@ -31,12 +31,19 @@ from ..clouds import PointCloudDensity, ball_cloud_js
 from .methods import load_fit
 
 import jax.tree_util as pt
+import jax
 from typing import Tuple, Union
 from os import PathLike
 from pathlib import Path
 import jax.numpy as jnp
+import numpy as np
+import multiprocessing
+import threading
 import logging
 import shutil
+import subprocess
+import time
+import os
 import tqdm
 
 
@@ -64,15 +71,16 @@ def setup_scan_config(
         name_fmt_string = model_name_fmt
         model_name_fmt = lambda **kwargs: name_fmt_string.format(**kwargs)
     scan_params = flatten(scan_params)
-    n_models = len(scan_params[list(scan_params.keys())[0]])
+    param_names = list(scan_params.keys())
+    param_vals = [scan_params[p_name] for p_name in param_names]
+    if len(set(len(p_vals) for p_vals in param_vals)) > 1:
+        raise ValueError("All scan parameters must have the same length.")
 
     # Fill out main scan config
     config = scan_cfg_structure.copy()
     config["models"] = {
-        model_name_fmt(scan_name=name, i=i): {
-            p_name: p_vals[i] for p_name, p_vals in scan_params.items()
-        }
-        for i in range(n_models)
+        model_name_fmt(scan_name=name, i=i): dict(zip(param_names, model_vals))
+        for i, model_vals in enumerate(zip(*param_vals))
     }
 
     # set up model config modified to run with `split` fit method
@@ -106,25 +114,207 @@ def run_scan(
     log_every: int = -1,
     progress: bool = False,
     force_restart: bool = False,
+    parallel_devices: int = None,
+):
+    """Load configs and run the desired scan.
+
+    Parameters
+    ----------
+    parallel_devices : int, optional
+        Number of devices across which to distribute model fits. If greater
+        than one, models are split between worker processes, each started
+        with `CUDA_VISIBLE_DEVICES` restricted to a single device index.
+    """
+    scan_config = load_config(project.scan(scan_name) / "scan.yml")
+    model_names = list(scan_config["models"].keys())
+    fit_kws = dict(
+        project=project,
+        scan_name=scan_name,
+        checkpoint_every=checkpoint_every,
+        log_every=log_every,
+        progress=progress,
+        force_restart=force_restart,
+    )
+
+    if parallel_devices is None or parallel_devices < 2:
+        _run_scan_models(model_names, dataset=dataset, **fit_kws)
+        return
+
+    # Workers are started in fresh interpreters since JAX is not fork-safe.
+    # Nothing is prepared on device here: JAX would start its backend on
+    # every GPU, and device arrays sent to a worker would do the same there
+    # while being unpickled. Workers instead receive host data only and
+    # prepare the dataset themselves.
+    visible_devices = os.environ.get("CUDA_VISIBLE_DEVICES")
+    device_ids = _visible_device_ids()
+    if parallel_devices > len(device_ids):
+        raise ValueError(
+            f"parallel_devices={parallel_devices} exceeds the "
+            f"{len(device_ids)} available devices {device_ids}."
+        )
+
+    if dataset is not None:
+        dataset = dataset.to_host()
+    ctx = multiprocessing.get_context("spawn")
+    n_workers = min(parallel_devices, len(model_names))
+    workers = [
+        ctx.Process(
+            target=_run_scan_models,
+            args=(model_names[i::n_workers],),
+            kwargs=dict(dataset=dataset, **fit_kws),
+        )
+        for i in range(n_workers)
+    ]
+    try:
+        for device_id, worker in zip(device_ids, workers):
+            # a spawned worker inherits the environment at start, so its
+            # device is fixed before any of its own code runs
+            os.environ["CUDA_VISIBLE_DEVICES"] = device_id
+            worker.start()
+    finally:
+        if visible_devices is None:
+            os.environ.pop("CUDA_VISIBLE_DEVICES", None)
+        else:
+            os.environ["CUDA_VISIBLE_DEVICES"] = visible_devices
+    for worker in workers:
+        worker.join()
+    failed = [d for d, w in zip(device_ids, workers) if w.exitcode != 0]
+    if len(failed):
+        raise RuntimeError(
+            f"Scan workers for devices {failed} exited with errors."
+        )
+
+
+def _visible_device_ids():
+    """Device ids that workers may be restricted to, without starting JAX.
+
+    Taken from the parent's `CUDA_VISIBLE_DEVICES` mask if it has one, so
+    that workers stay within it, and otherwise from `nvidia-smi`."""
+    mask = os.environ.get("CUDA_VISIBLE_DEVICES")
+    if mask is not None:
+        return [d.strip() for d in mask.split(",") if d.strip()]
+    try:
+        listed = subprocess.run(
+            ["nvidia-smi", "--list-gpus"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return []
+    return [str(i) for i, line in enumerate(listed.splitlines()) if line]
+
+
+def _run_scan_models(
+    model_names,
+    project,
+    scan_name,
+    dataset,
+    checkpoint_every,
+    log_every,
+    progress,
+    force_restart,
 ):
-    """Load configs and run the desired scan."""
+    """Load scan configs and fit a subset of the scan's models.
+
+    Runs either in the calling process or in a worker started by `run_scan`.
+    """
     scan_config = load_config(project.scan(scan_name) / "scan.yml")
     model_config = load_model_config(project.scan(scan_name) / "base_model.yml")
-    if dataset is None:
-        dataset = load_dataset(model_config["dataset"])
-    for model_name, scan_params in scan_config["models"].items():
+    _fit_scan_models(
+        model_names,
+        project=project,
+        scan_models=scan_config["models"],
+        model_config=model_config,
+        dataset=dataset,
+        # alignment, feature reduction and splitting are shared by all models
+        # unless scan parameters modify them
+        share_prepared=not _scan_modifies_dataset(scan_config["models"]),
+        checkpoint_every=checkpoint_every,
+        log_every=log_every,
+        progress=progress,
+        force_restart=force_restart,
+    )
+
+
+def _fit_scan_models(
+    model_names,
+    project,
+    scan_models,
+    model_config,
+    dataset,
+    share_prepared,
+    checkpoint_every,
+    log_every,
+    progress,
+    force_restart,
+):
+    """Create and fit a subset of the models in a scan.
+
+    The dataset is loaded (if not given) and prepared only once a model that
+    still needs fitting is reached. If `share_prepared`, it is prepared once
+    under `model_config`; otherwise separately for each model."""
+    prepared = None
+    for model_name in model_names:
         if force_restart:
             model_dir = project.model(model_name)
             if model_dir.exists():
                 logging.info(f"Removing existing model {model_dir}")
-                shutil.rmtree(model_dir)
+                _remove_in_background(model_dir)
         model_dir, model_cfg = create_model(
             project,
             model_name,
             config=model_config,
-            config_overrides=scan_params,
+            config_overrides=scan_models[model_name],
         )
-        fit(model_dir, dataset, checkpoint_every, log_every, progress)
+        if fit_status(model_dir).startswith("finished"):
+            logging.info(f"Model at {model_dir} is already up to date.")
+            continue
+
+        if dataset is None:
+            dataset = load_dataset(model_config["dataset"])
+        if not share_prepared:
+            model_dataset, _ = prepare_dataset(dataset, model_cfg)
+        else:
+            if prepared is None:
+                prepared, _ = prepare_dataset(dataset, model_config)
+            model_dataset = prepared
+        fit(model_dir, model_dataset, checkpoint_every, log_every, progress)
+
+
+def _remove_in_background(path: Path):
+    """Move a directory out of the way and delete it on a separate thread."""
+    trash = path.with_name(f"{path.name}.trash-{time.time_ns()}")
+    path.rename(trash)
+    threading.Thread(target=_remove_trash, args=(trash,)).start()
+
+
+def _remove_trash(trash: Path):
+    def warn(func, path, exc_info):
+        logging.warning(
+            f"Could not remove {path} while deleting {trash}: {exc_info[1]}"
+        )
+
+    shutil.rmtree(trash, onerror=warn)
+
+
+# config sections (flattened prefixes) that determine the prepared dataset
+_dataset_config_prefixes = (
+    "dataset",
+    "alignment",
+    "features",
+    "fit.type",
+    "fit.split_",
+)
+
+
+def _scan_modifies_dataset(scan_models):
+    """Whether any model in a scan overrides dataset preparation parameters."""
+    return any(
+        key.startswith(_dataset_config_prefixes)
+        for params in scan_models.values()
+        for key in flatten(params)
+    )
 
 
 scan_cfg_structure = loads(
@@ -292,17 +482,62 @@ def load_and_prepare_scan_dataset(
         project, scan_name, model_name, allow_subsample
     )
     return prepare_scan_dataset(
-        dataset, cfg, all_versions, return_session_inv
+        dataset,
+        cfg,
+        all_versions=all_versions,
+        return_session_inv=return_session_inv,
     ) + (cfg,)
 
 
+def _load_model_fit(project, model_name, _checkpoint=None, _cfg=None):
+    """Load checkpoint and config for a model if not given.
+
+    Scan-level helpers load each model once and pass the results down, so
+    nothing is cached here: a checkpoint read from disk is never stale."""
+    if _checkpoint is None:
+        _checkpoint = load_fit(project.model(model_name))
+    if _cfg is None:
+        _cfg = load_model_config(project.model_config(model_name))
+    return _checkpoint, _cfg
+
+
+def _induced_model_keypoints(dataset, cfg, checkpoint, return_features=False):
+    """Reference session keypoints induced on each body by a fitted model."""
+    return induced_reference_keypoints(
+        dataset,
+        cfg,
+        get_model(cfg).morph,
+        checkpoint["params"].morph,
+        to_body=None,  # map to all bodies
+        include_reference=True,
+        return_features=return_features,
+    )
+
+
+def _jit_inflate(features):
+    """Dataset inflation under a `features` config, with the array
+    computation compiled once and reused across calls."""
+    inflate_array = jax.jit(lambda arr: inflate(arr, features))
+    return lambda dataset: dataset.update(data=inflate_array(dataset.data))
+
+
+def _session_body_names(dataset, _body_inv):
+    """Map each session listed in `_body_inv` to its body name in `dataset`."""
+    return {
+        s: dataset.session_body_name(s)
+        for sessions in _body_inv.values()
+        for s in sessions
+    }
+
+
 def model_withinbody_reconst_errs(
     project,
     model_name,
     dataset=None,
     _body_inv=None,
     _inflate=None,
-    progress=False,
+    _checkpoint=None,
+    _cfg=None,
 ):
     """Keypoint errors induced by morphing across examples of the same body
     in a split-dataset scan."""
@@ -311,48 +546,88 @@ def model_withinbody_reconst_errs(
     # after morphing to a within-body reference session of the model that
     # did not know these bodies should be identical
 
-    checkpoint = load_fit(project.model(model_name))
-    cfg = load_model_config(project.model_config(model_name))
+    checkpoint, cfg = _load_model_fit(project, model_name, _checkpoint, _cfg)
     if dataset is None:
-        dataset, _body_inv, _ = load_and_prepare_scan_dataset(cfg)
-        _inflate = lambda x: inflate(x, cfg["features"])
+        dataset, _body_inv, _, _ = load_and_prepare_scan_dataset(cfg)
+    if _inflate is None:
+        _inflate = _jit_inflate(cfg["features"])
     model = get_model(cfg)
 
     # select session/body for canonical pose space
-    global_ref_body = dataset.sess_bodies[dataset.ref_session]
+    global_ref_body = dataset.session_body_name(dataset.ref_session)
+
+    # morph non-reference sessions of all bodies together: the morph
+    # model already handles a distinct source/target body per session
+    nonref_sessions = {b: _body_inv[b][1:] for b in _body_inv}
+    all_nonref = [s for b in _body_inv for s in nonref_sessions[b]]
+    params = checkpoint["params"].morph
+
+    # stack two copies of the nonref sessions: the first with their own
+    # bodies, the second pretending each session has the body of its
+    # within-body reference session
+    ref_copies = {s: f"ref-{s}" for s in all_nonref}
+    nonref_data = jnp.concatenate([dataset.get_session(s) for s in all_nonref])
+    n_frames = len(nonref_data)
+    offsets = np.cumsum([0] + [dataset.session_length(s) for s in all_nonref])
+    offsets = [int(o) for o in offsets]
+    n_nonref = len(all_nonref)
+    session_ids = {
+        **{s: i for i, s in enumerate(all_nonref)},
+        **{ref_copies[s]: n_nonref + i for i, s in enumerate(all_nonref)},
+    }
+    stacked = dataset.update(
+        data=jnp.concatenate([nonref_data, nonref_data]),
+        stack_meta=dataset.stack_meta.update(
+            slices={
+                **{
+                    session_ids[s]: (offsets[i], offsets[i + 1])
+                    for i, s in enumerate(all_nonref)
+                },
+                **{
+                    session_ids[ref_copies[s]]: (
+                        n_frames + offsets[i],
+                        n_frames + offsets[i + 1],
+                    )
+                    for i, s in enumerate(all_nonref)
+                },
+            },
+            length=2 * n_frames,
+        ),
+        session_meta=dataset.session_meta.update(
+            session_ids=session_ids,
+            session_bodies={
+                **{s: dataset.session_body_name(s) for s in all_nonref},
+                **{
+                    ref_copies[s]: dataset.session_body_name(_body_inv[b][0])
+                    for b in _body_inv
+                    for s in nonref_sessions[b]
+                },
+            },
+        ),
+    )
 
-    errs = {}
-    pbar = _optional_pbar(_body_inv[b], progress)
-    for b in pbar:
-        nonref_sessions = _body_inv[b][1:]
-        ref_body = dataset.sess_bodies[_body_inv[b][0]]
-        # nonref sessions mapped to canonical pose space
-        subset = dataset.session_subset(nonref_sessions, bad_ref_ok=True)
-        mapped_split_body = apply_bodies(
-            model.morph,
-            checkpoint["params"].morph,
-            subset,
-            {s: global_ref_body for s in nonref_sessions},
-        )
-        mapped_split_body = _inflate(mapped_split_body)
-        # pretend all nonref sessions have body `ref_body`, mapped to canonical pose space
-        with_ref_body = subset.with_sess_bodies(
-            {s: ref_body for s in nonref_sessions}
+    # both copies are mapped to canonical pose space and from there onto the
+    # global reference body in a single pass
+    mapped = _inflate(
+        model.morph.from_canonical(
+            params,
+            model.morph.to_canonical(params, stacked),
+            {s: global_ref_body for s in session_ids},
         )
-        mapped_ref_body = apply_bodies(
-            model.morph,
-            checkpoint["params"].morph,
-            with_ref_body,
-            {s: global_ref_body for s in nonref_sessions},
-        )
-        mapped_ref_body = _inflate(mapped_ref_body)
+    )
 
-        errs[b] = {
-            s: reconst_errs(
-                mapped_ref_body.get_session(s), mapped_split_body.get_session(s)
-            )
-            for s in nonref_sessions
-        }
+    # the two copies share the same stacking, so frame-wise errors may be
+    # computed in a single pass and then averaged within sessions
+    frame_errs = reconst_errs(
+        mapped.data[n_frames:], mapped.data[:n_frames], average=False
+    )
+    errs = {}
+    nonref_ix = {s: i for i, s in enumerate(all_nonref)}
+    for b in _body_inv:
+        errs[b] = {}
+        for s in nonref_sessions[b]:
+            i = nonref_ix[s]
+            errs[b][s] = frame_errs[offsets[i] : offsets[i + 1]].mean(axis=0)
 
     return errs
 
@@ -362,6 +637,9 @@ def model_withinbody_induced_errs(
     model_name,
     dataset=None,
     _body_inv=None,
+    _checkpoint=None,
+    _cfg=None,
+    _induced_kpts=None,
 ):
     """Keypoint errors induced by morphing across examples of the same body
     in a split-dataset scan."""
@@ -370,38 +648,38 @@ def model_withinbody_induced_errs(
     # after morphing to a within-body reference session of the model that
     # did not know these bodies should be identical
 
-    checkpoint = load_fit(project.model(model_name))
-    cfg = checkpoint["config"]
+    checkpoint, cfg = _load_model_fit(project, model_name, _checkpoint, _cfg)
     if dataset is None:
-        dataset, _body_inv, _ = load_and_prepare_scan_dataset(cfg)
+        dataset, _body_inv, _, _ = load_and_prepare_scan_dataset(cfg)
         _inflate = lambda x: inflate(x, cfg["features"])
-    model = get_model(cfg)
 
-    induced_kpts = induced_reference_keypoints(
-        dataset,
-        cfg,
-        model.morph,
-        checkpoint["params"].morph,
-        to_body=None,  # map to all bodies
-        include_reference=True,
-    )
+    induced_kpts = _induced_kpts
+    if induced_kpts is None:
+        induced_kpts = _induced_model_keypoints(dataset, cfg, checkpoint)
 
+    sess_to_body = _session_body_names(dataset, _body_inv)
     errs = {}
     for b in _body_inv:
         # _body_inv: map (pre-split) body to sessions with that body
         # Now map sessions in _body_inv[b] to their (post-split) body name
         # Also separate out into a reference session within _body_inv[b] (the
         # first) entry and the other sessions
-        body_ref = dataset.session_body_name(_body_inv[b][0])
+        body_ref = sess_to_body[_body_inv[b][0]]
         nonref_sessions = _body_inv[b][1:]
-        nonref_bodies = [dataset.session_body_name(s) for s in nonref_sessions]
+        nonref_bodies = [sess_to_body[s] for s in nonref_sessions]
         # induced_kpts is indexed by (post-split) body names
         # measure errors between the reference session for this (pre-split)
         # body, that is `body_ref` and each of the non-reference sessions
-        errs[b] = {
-            s: reconst_errs(induced_kpts[b], induced_kpts[body_ref])
-            for b, s in zip(nonref_bodies, nonref_sessions)
-        }
+        if not len(nonref_sessions):
+            errs[b] = {}
+            continue
+        # all induced keypoints derive from the reference session so they may
+        # be stacked and compared to `body_ref` in a single call
+        body_errs = jax.vmap(reconst_errs, in_axes=(0, None))(
+            jnp.stack([induced_kpts[nb] for nb in nonref_bodies]),
+            induced_kpts[body_ref],
+        )
+        errs[b] = dict(zip(nonref_sessions, body_errs))
     return errs
 
 
@@ -413,21 +691,27 @@ def withinbody_reconst_errs(project, scan_name, progress=False):
         models = list(scan_cfg["models"].keys())
     else:
         models = scan_name
-    dataset, _body_inv, cfg = load_and_prepare_scan_dataset(
+    dataset, _body_inv, _, cfg = load_and_prepare_scan_dataset(
         project, model_name=models[0]
     )
-    _inflate = lambda x: inflate(x, cfg["features"])
-    return {
-        model: model_withinbody_reconst_errs(
+    # sessions are gathered and morphed once per model, so transfer data
+    # only once
+    dataset = dataset.to_device()
+    # compiled once and shared by all models in the scan
+    _inflate = _jit_inflate(cfg["features"])
+    errs = {}
+    for model in _optional_pbar(models, progress):
+        checkpoint, model_cfg = _load_model_fit(project, model)
+        errs[model] = model_withinbody_reconst_errs(
             project,
             model,
             dataset=dataset,
             _body_inv=_body_inv,
             _inflate=_inflate,
-            progress=model if progress else False,
+            _checkpoint=checkpoint,
+            _cfg=model_cfg,
         )
-        for model in models
-    }
+    return errs
 
 
 def _resolve_scan_model_list(project, scan_name):
@@ -442,8 +726,10 @@ def _load_dataset_or_calc_metadata(
 ):
     # load dataset if not given, or get split metadata if dataset was given
     if dataset is None:
-        dataset, (_body_inv, _session_inv), _ = load_and_prepare_scan_dataset(
-            project, model_name=model_name, return_session_inv=True
+        dataset, (_body_inv, _session_inv), _, _ = (
+            load_and_prepare_scan_dataset(
+                project, model_name=model_name, return_session_inv=True
+            )
         )
     else:
         _body_inv, _session_inv = split_meta
@@ -497,6 +783,19 @@ def withinsession_induced_errs(
     }
 
 
+def _fit_cloud(cache, key, data, k=15):
+    """Fit a `PointCloudDensity` to `data`, reusing the fit stored in `cache`
+    under `key` if one exists."""
+    if key not in cache:
+        cache[key] = PointCloudDensity(k=k, workers=-1).fit(data)
+    return cache[key]
+
+
+def _ref_session_clouds(dataset, ref_cloud):
+    """Session cloud cache seeded with the fit to the reference session."""
+    return {dataset.session_name(dataset.ref_session): ref_cloud}
+
+
 def base_jsds_to_reference(
     project,
     model_name=None,
@@ -504,29 +803,42 @@ def base_jsds_to_reference(
     _body_inv=None,
     ref_cloud=None,
     progress=False,
+    session_clouds=None,
 ):
     """
     Compute JSDs to reference session for each body in the dataset.
+
+    Parameters
+    ----------
+    session_clouds : dict, optional
+        Point cloud densities fit to sessions of `dataset`, keyed by session
+        name. Populated with any missing sessions.
     """
 
     assert (
         model_name is not None or dataset is not None
     ), "Need either `model_name` or `dataset`."
     if dataset is None:
-        dataset, _body_inv, _ = load_and_prepare_scan_dataset(
+        dataset, _body_inv, _, _ = load_and_prepare_scan_dataset(
             project, model_name=model_name
         )
-        ref_cloud = PointCloudDensity(k=15).fit(
+        ref_cloud = PointCloudDensity(k=15, workers=-1).fit(
             dataset.get_session(dataset.ref_session)
         )
+        session_clouds = _ref_session_clouds(dataset, ref_cloud)
+
+    if session_clouds is None:
+        session_clouds = {}
 
     # transform all sessions to the global reference session's body
     pbar = _optional_pbar(_body_inv, progress)
     jsds = {
         b: {
-            s: ball_cloud_js(
-                ref_cloud,
-                PointCloudDensity(k=15).fit(dataset.get_session(s)),
+            s: float(
+                ball_cloud_js(
+                    ref_cloud,
+                    _fit_cloud(session_clouds, s, dataset.get_session(s)),
+                )
             )
             for s in _body_inv[b]
         }
@@ -543,44 +855,45 @@ def model_jsds_to_reference(
     _body_inv=None,
     ref_cloud=None,
     progress=False,
+    _checkpoint=None,
+    _cfg=None,
+    _induced_kpts=None,
 ):
     """JS discances of each session (after normalization) to the reference
     session."""
-    cfg = load_model_config(project.model_config(model_name))
+    checkpoint, cfg = _load_model_fit(project, model_name, _checkpoint, _cfg)
     if dataset is None:
-        dataset, _body_inv, _ = load_and_prepare_scan_dataset(
+        dataset, _body_inv, _, _ = load_and_prepare_scan_dataset(
             project, model_name=model_name
         )
-        ref_cloud = PointCloudDensity(k=15).fit(
+        ref_cloud = PointCloudDensity(k=15, workers=-1).fit(
             dataset.get_session(dataset.ref_session)
         )
-    model = get_model(cfg)
-    checkpoint = load_fit(project.model(model_name))
 
-    induced_kpts = induced_reference_keypoints(
-        dataset,
-        cfg,
-        model.morph,
-        checkpoint["params"].morph,
-        to_body=None,  # map to all bodies
-        include_reference=True,
-        return_features=True,
-    )
+    induced_kpts = _induced_kpts
+    if induced_kpts is None:
+        induced_kpts = _induced_model_keypoints(
+            dataset, cfg, checkpoint, return_features=True
+        )
 
     # transform all sessions to the global reference session's body
+    # sessions sharing a (post-split) body share induced keypoints, so fit
+    # each body's point cloud only once
+    sess_to_body = _session_body_names(dataset, _body_inv)
+    body_clouds = {}
     jsds = {}
     for b in _optional_pbar(_body_inv, progress):
 
         # compute JS distances
-        jsds[b] = {
-            s: ball_cloud_js(
-                ref_cloud,
-                PointCloudDensity(k=15).fit(
-                    induced_kpts[dataset.session_body_name(s)]
-                ),
+        jsds[b] = {}
+        for s in _body_inv[b]:
+            body = sess_to_body[s]
+            jsds[b][s] = float(
+                ball_cloud_js(
+                    ref_cloud,
+                    _fit_cloud(body_clouds, body, induced_kpts[body]),
+                )
             )
-            for s in _body_inv[b]
-        }
 
     return jsds
 
@@ -597,47 +910,132 @@ def jsds_to_reference(
         split_meta,
     )
 
-    ref_cloud = PointCloudDensity(k=15).fit(
+    ref_cloud = PointCloudDensity(k=15, workers=-1).fit(
         dataset.get_session(dataset.ref_session)
     )
-    model_jsds = {
-        model: model_jsds_to_reference(
+    model_jsds = {}
+    for model in models:
+        checkpoint, model_cfg = _load_model_fit(project, model)
+        model_jsds[model] = model_jsds_to_reference(
             project,
             model,
             dataset=dataset,
             _body_inv=_body_inv,
             ref_cloud=ref_cloud,
             progress=str(model) if progress else False,
+            _checkpoint=checkpoint,
+            _cfg=model_cfg,
         )
-        for model in models
-    }
     base_jsds = base_jsds_to_reference(
         project,
         dataset=dataset,
         _body_inv=_body_inv,
         ref_cloud=ref_cloud,
         progress="Unmorphed" if progress else False,
+        session_clouds=_ref_session_clouds(dataset, ref_cloud),
     )
 
-    # warn if any JSDs negative
-    for b, s in [(b, s) for b, l in _body_inv.items() for s in l]:
-        neg_models = [m for m, jsds in model_jsds.items() if jsds[b][s] < 0]
-        if base_jsds[b][s] < 0:
-            neg_models += ["unmorphed"]
-        if len(neg_models):
-            logging.warning(
-                f"Negative JSD for {s} under models: {' '.join(neg_models)}"
-            )
+    _warn_negative_jsds(_body_inv, model_jsds, base_jsds)
     return model_jsds, base_jsds, dataset
 
 
+def _warn_negative_jsds(_body_inv, model_jsds, base_jsds):
+    # warn if any JSDs negative
+    pairs = [(b, s) for b, l in _body_inv.items() for s in l]
+    names = np.array(list(model_jsds.keys()) + ["unmorphed"])
+    # (n_models + 1, n_sessions) array of all JSDs
+    all_jsds = np.array(
+        [
+            [jsds[b][s] for b, s in pairs]
+            for jsds in [*model_jsds.values(), base_jsds]
+        ]
+    ).reshape(len(names), len(pairs))
+    negative = all_jsds < 0
+    for i in np.where(negative.any(axis=0))[0]:
+        logging.warning(
+            f"Negative JSD for {pairs[i][1]} under models: "
+            f"{' '.join(names[negative[:, i]])}"
+        )
+
+
+def run_scan_analysis(
+    project, scan_name, dataset=None, split_meta=None, progress=False
+):
+    """Within-body induced errors and JS distances to reference session for
+    each model in a scan, morphing the reference session once per model.
+
+    Returns
+    -------
+    induced_errs : dict
+        Within-body induced errors, as in `withinbody_induced_errs`.
+    model_jsds, base_jsds : dict
+        JS distances to reference session, as in `jsds_to_reference`.
+    dataset : Dataset
+    """
+    models = _resolve_scan_model_list(project, scan_name)
+    dataset, _body_inv, _ = _load_dataset_or_calc_metadata(
+        project,
+        models[0],
+        dataset,
+        split_meta,
+    )
+
+    ref_cloud = PointCloudDensity(k=15, workers=-1).fit(
+        dataset.get_session(dataset.ref_session)
+    )
+    induced_errs = {}
+    model_jsds = {}
+    for model in _optional_pbar(models, progress):
+        checkpoint, cfg = _load_model_fit(project, model)
+        # features are shared by both passes; errors are measured on keypoints
+        induced_feats = _induced_model_keypoints(
+            dataset, cfg, checkpoint, return_features=True
+        )
+        induced_kpts = {
+            b: inflate(feats, cfg["features"])
+            for b, feats in induced_feats.items()
+        }
+        induced_errs[model] = model_withinbody_induced_errs(
+            project,
+            model,
+            dataset=dataset,
+            _body_inv=_body_inv,
+            _checkpoint=checkpoint,
+            _cfg=cfg,
+            _induced_kpts=induced_kpts,
+        )
+        model_jsds[model] = model_jsds_to_reference(
+            project,
+            model,
+            dataset=dataset,
+            _body_inv=_body_inv,
+            ref_cloud=ref_cloud,
+            _checkpoint=checkpoint,
+            _cfg=cfg,
+            _induced_kpts=induced_feats,
+        )
+    base_jsds = base_jsds_to_reference(
+        project,
+        dataset=dataset,
+        _body_inv=_body_inv,
+        ref_cloud=ref_cloud,
+        progress="Unmorphed" if progress else False,
+        session_clouds=_ref_session_clouds(dataset, ref_cloud),
+    )
+
+    _warn_negative_jsds(_body_inv, model_jsds, base_jsds)
+    return induced_errs, model_jsds, base_jsds, dataset
+
+
 def merge_param_hist_with_hyperparams(
     model: JointModel, params: JointModelParams, param_hist: ArrayTrace
 ):
-    # extend hyperparameters to match the length of the param_hist
+    # extend hyperparameters to match the length of the param_hist, as
+    # read-only views with a zero stride along the step axis so that the
+    # underlying buffer is not duplicated for each step
     stat, hype, _ = params.by_type()
-    lengthen = lambda arr: jnp.broadcast_to(
-        jnp.array(arr)[None], (len(param_hist), *jnp.array(arr).shape)
+    lengthen = lambda arr: np.broadcast_to(
+        np.asarray(arr)[None], (len(param_hist), *np.shape(arr))
     )
     long_stat = pt.tree_map(lengthen, stat)
     long_hype = pt.tree_map(lengthen, hype)
@@ -649,6 +1047,13 @@ def merge_param_hist_with_hyperparams(
     return full_params
 
 
+@jax.jit
+def _select_step(tree, step):
+    # single compiled slice of all leaves; `step` is traced so that selecting
+    # a new step does not trigger recompilation
+    return pt.tree_map(lambda arr: arr[step], tree)
+
+
 def select_param_step(
     model: JointModel,
     params: JointModelParams,
@@ -661,5 +1066,5 @@ def select_param_step(
         model,
         stat,
         hype,
-        pt.tree_map(lambda arr: arr[step], param_hist._tree),
+        _select_step(param_hist._tree, jnp.asarray(step, dtype=jnp.int32)),
     )
@@ -139,7 +139,11 @@ def bone_transform(keypts, transform_data):
 
 
 def join_with_root(bones, roots, transform_data):
-    return np.insert(bones, transform_data["root"], roots, axis=-2)
+    root = int(transform_data["root"])
+    return jnp.concatenate(
+        [bones[..., :root, :], roots[..., None, :], bones[..., root:, :]],
+        axis=-2,
+    )
 
 
 def inverse_bone_transform(roots, bones, transform_data):
@@ -309,6 +309,24 @@ class Dataset:
                 ret._stack_body_ids = self._stack_body_ids
         return ret
 
+    def to_device(self) -> "Dataset":
+        """Return a dataset whose data is a device-resident JAX array.
+
+        Session lookups then slice an existing device buffer rather than
+        transferring host data on each access."""
+        if isinstance(self._data, jnp.ndarray):
+            return self
+        return self.update(data=jnp.asarray(self._data))
+
+    def to_host(self) -> "Dataset":
+        """Return a dataset whose data is a NumPy array, e.g. to be sent to
+        another process without creating device arrays there."""
+        ret = self.update(data=np.asarray(self._data))
+        # cached id lookups may be device arrays
+        ret._stack_body_ids = None
+        ret._stack_session_ids = None
+        return ret
+
     # ------------------------------------------------------ simple access ----
 
     @property
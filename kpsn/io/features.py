@@ -1,14 +1,19 @@
 from ..io.dataset_refactor import Dataset
 from ..project.paths import Project
 from ..config import load_calibration_data, save_calibration_data
-from ..pca import fit_with_center, CenteredPCA
+from ..pca import fit_with_center, sum_over_batches, CenteredPCA
 from ..io import armature
 
+from jax import lax
 import jax.numpy as jnp
+import jax
 import jax.random as jr
+import numpy as np
 import jax.numpy.linalg as jla
 from sklearn.decomposition import PCA
 import matplotlib.pyplot as plt
+import collections
+import functools
 import logging
 
 
@@ -97,12 +102,25 @@ class locked_pts(reducer):
     def reduce_array(arr, config):
         """Reduce an array of keypoints to an array of features by removing
         dimensions marked in config"""
-        flat_data = arr.reshape((arr.shape[0], -1))
-        ix_mask = jnp.isin(
-            jnp.arange(flat_data.shape[-1]),
-            jnp.array(config["calibration_data"]["reduce_ixs"]),
-        )
-        return flat_data[..., ~ix_mask]
+        n_feats = int(np.prod(arr.shape[1:]))
+        return locked_pts.compile(config["calibration_data"], n_feats)(arr)
+
+    @staticmethod
+    def compile(calib, n_feats):
+        """Jitted reduction specialized to a calibration.
+
+        Parameters
+        ----------
+        calib : dict
+            `calibration_data` section of the features config.
+        n_feats : int
+            Number of flattened keypoint dimensions of arrays to be reduced.
+
+        Returns
+        -------
+        reduce : callable
+            Maps arrays of shape (n_samples, ...) to reduced features."""
+        return _locked_reduce_fn(tuple(_locked_keep_ixs(calib, n_feats)))
 
     @staticmethod
     def inflate_array(arr, config):
@@ -114,9 +132,15 @@ class locked_pts(reducer):
         if arr.ndim < 2:
             arr = arr[None]
             inflated_shape = (calib["n_kpts"], -1)
-        # add indices that were dropped
-        for reduced_ix in sorted(calib["reduce_ixs"]):
-            arr = jnp.insert(arr, reduced_ix, 0, axis=-1)
+        # scatter features into their original positions, leaving zeros at
+        # indices that were dropped
+        n_full = arr.shape[-1] + len(calib["reduce_ixs"])
+        keep_ixs = jnp.asarray(_locked_keep_ixs(calib, n_full))
+        arr = (
+            jnp.zeros(arr.shape[:-1] + (n_full,), arr.dtype)
+            .at[..., keep_ixs]
+            .set(arr)
+        )
         # return, reshaped to number of keypoints
         return arr.reshape(inflated_shape)
 
@@ -125,10 +149,15 @@ class locked_pts(reducer):
         """Calibrate feature extraction for a dataset."""
         # find keypoints with zero std
         flat_data = dataset.data.reshape((dataset.data.shape[0], -1))
-        reduce_ixs = jnp.where(flat_data.std(axis=0) < 1e-5)[0].tolist()
+        # on host, comparing variance against the squared threshold
+        flat_var = np.asarray(flat_data).var(axis=0, dtype=np.float64)
+        reduce_ixs = np.where(flat_var < 1e-10)[0].tolist()
 
         return dict(
             reduce_ixs=reduce_ixs,
+            keep_ixs=_locked_keep_ixs(
+                dict(reduce_ixs=reduce_ixs), flat_data.shape[-1]
+            ),
             n_kpts=len(dataset.aux["keypoint_names"]),
         )
 
@@ -144,6 +173,28 @@ class locked_pts(reducer):
         ), "Feature reduction not calibrated."
 
 
+def _locked_keep_ixs(calib, n_feats):
+    """Indices of flattened keypoint dimensions retained by `locked_pts`.
+
+    Falls back to computing from `reduce_ixs` for calibrations that predate
+    storing `keep_ixs`."""
+    if calib.get("keep_ixs") is not None:
+        return calib["keep_ixs"]
+    reduce_ixs = set(calib["reduce_ixs"])
+    return [i for i in range(n_feats) if i not in reduce_ixs]
+
+
+@functools.lru_cache(maxsize=None)
+def _locked_reduce_fn(keep_ixs):
+    """Jitted `locked_pts` reduction with `keep_ixs` baked in as a constant."""
+    keep_ixs = np.asarray(keep_ixs, dtype=np.int32)
+
+    def reduce(arr):
+        return arr.reshape((arr.shape[0], -1))[..., keep_ixs]
+
+    return jax.jit(reduce)
+
+
 class no_reduction(reducer):
     type_name = "no_reduction"
     defaults = dict()
@@ -185,6 +236,28 @@ class no_reduction(reducer):
         return True
 
 
+# most recently used calibrations first; bounded so that calibrations which
+# are no longer in use do not stay alive for the life of the process
+_centered_pcas = collections.OrderedDict()
+_max_centered_pcas = 8
+
+
+def _calib_pca(calib):
+    """`CenteredPCA` for `pcs` calibration data, constructed once per
+    calibration."""
+    key = (id(calib["center"]), id(calib["pcs"]))
+    if key in _centered_pcas:
+        _centered_pcas.move_to_end(key, last=False)
+    else:
+        # the CenteredPCA holds references to both arrays, so their ids cannot
+        # be reused by other objects while the cache entry exists
+        _centered_pcas[key] = CenteredPCA(calib["center"], calib["pcs"])
+        _centered_pcas.move_to_end(key, last=False)
+        if len(_centered_pcas) > _max_centered_pcas:
+            _centered_pcas.popitem(last=True)
+    return _centered_pcas[key]
+
+
 class pcs(reducer):
     """Feature reduction based on principal components of a full dataset."""
 
@@ -193,6 +266,8 @@ class pcs(reducer):
         calibration=dict(tgt_variance=0.98),
         max_pts=10000,
         subset_seed=823,
+        batch_size=None,
+        matmul_dtype=None,
     )
 
     @staticmethod
@@ -200,14 +275,14 @@ class pcs(reducer):
         """Reduce an array of keypoints to an array of features."""
         flat_data = arr.reshape((arr.shape[0], -1))
         calib = config["calibration_data"]
-        pcs = CenteredPCA(calib["center"], calib["pcs"])
+        pcs = _calib_pca(calib)
         return pcs.coords(flat_data)[..., : calib["n_dims"]]
 
     @staticmethod
     def inflate_array(arr, config):
         """Reconstruct an array of keypoints from an array of features."""
         calib = config["calibration_data"]
-        pcs = CenteredPCA(calib["center"], calib["pcs"])
+        pcs = _calib_pca(calib)
         # add zeros for any dimensions that were removed
         n_pcs = pcs._pcadata.s.shape[0]
         zeroes = jnp.zeros(arr.shape[:-1] + (n_pcs - calib["n_dims"],))
@@ -255,45 +330,74 @@ class pcs(reducer):
             )
             flat_data = flat_data[subset]
 
-        # fit PCA
-        pcs = fit_with_center(flat_data)
+        # fit PCA, accumulating covariance in batches and forming it in
+        # reduced precision if requested
+        matmul_dtype = config.get("matmul_dtype")
+        pcs = fit_with_center(
+            flat_data,
+            batch_size=config.get("batch_size"),
+            matmul_dtype=(
+                None if matmul_dtype is None else jnp.dtype(matmul_dtype)
+            ),
+        )
         # MAX_COMPONENTS = 20
         # pcs = PCA(n_components=MAX_COMPONENTS)
         # coords = pcs.fit_transform()
 
         # -- choose number of dimensions in reduced data
-        scree = (
-            jnp.cumsum(pcs._pcadata.variances())
-            / pcs._pcadata.variances().sum()
-        )
+        variances = pcs._pcadata.variances()
+        scree = jnp.cumsum(variances) / variances.sum()
         if n_dims is None:
-            selected_ix = jnp.argmax(
-                scree > config["calibration"]["tgt_variance"]
+            # scree is non-decreasing: first index exceeding the target
+            selected_ix = jnp.searchsorted(
+                scree, config["calibration"]["tgt_variance"], side="right"
             )
+            selected_ix = jnp.minimum(selected_ix, len(scree) - 1)
         else:
             selected_ix = n_dims - 1
+        n_keep = int(selected_ix) + 1
 
         # -- keypoint errors resulting from PCA reduction
-        flat_arr = flat_data - pcs._center[None]
-        coords = pcs._pcadata.coords(flat_arr)
-        # (n_samples, n_dims, n_dims), sum over axis 1 (aka -2) gives flat_data
-        reconst_parts = coords[..., None] * pcs._pcadata.pcs()[None, ...]
-        cum_reconst = jnp.cumsum(reconst_parts, axis=-2)
         n_kpts = len(dataset.aux["keypoint_names"])
         kpt_shape = (
             n_kpts,
-            flat_arr.shape[-1] // n_kpts,
+            flat_data.shape[-1] // n_kpts,
+        )
+        kept_pcs = pcs._pcadata.pcs()[:n_keep]
+
+        def summed_errs(batch):
+            # add one component at a time to the reconstruction, recording
+            # only the keypoint error summed over frames at each number of
+            # components up to the number selected
+            centered = batch - pcs._center[None]
+            coords = centered @ kept_pcs.T
+
+            def add_component(reconst, coord_and_pc):
+                coord, pc = coord_and_pc
+                reconst = reconst + coord[:, None] * pc[None]
+                dists = (reconst - centered).reshape((-1,) + kpt_shape)
+                return reconst, jla.norm(dists, axis=-1).sum(axis=0)
+
+            _, errs = lax.scan(
+                add_component,
+                jnp.zeros_like(centered),
+                (coords.T, kept_pcs),
+            )
+            return errs
+
+        # streamed over batches of frames like the covariance, if requested
+        mean_errs = (
+            sum_over_batches(summed_errs, flat_data, config.get("batch_size"))
+            / flat_data.shape[0]
         )
-        cum_dists = cum_reconst - flat_arr[..., None, :]
-        errs = jla.norm(cum_dists.reshape(flat_arr.shape + kpt_shape), axis=-1)
 
         # outputs to main config and calibration_data
         return dict(
             pcs=pcs._pcadata,
             center=pcs._center,
-            mean_errs=errs.mean(axis=0),
+            mean_errs=mean_errs,
             n_kpts=n_kpts,
-            n_dims=int(selected_ix) + 1,
+            n_dims=n_keep,
         )
 
     @staticmethod
@@ -303,11 +407,9 @@ class pcs(reducer):
 
         config = config["features"]
         calib = config["calibration_data"]
-        pcs = CenteredPCA(calib["center"], calib["pcs"])
-        cumsum = (
-            jnp.cumsum(pcs._pcadata.variances())
-            / pcs._pcadata.variances().sum()
-        )
+        pcs = _calib_pca(calib)
+        variances = pcs._pcadata.variances()
+        cumsum = jnp.cumsum(variances) / variances.sum()
 
         fig, ax = plt.subplots(1, 2, figsize=(6, 2.0))
 
@@ -1,39 +1,37 @@
+from jax import lax
 import jax.tree_util as pt
 import jax.numpy as jnp
+import functools
+import jax
 
 
 class ArrayTrace:
     def __init__(self, n_steps):
         self._n_steps = n_steps
         self._tree = None
+        self._path_index = None
 
     def initialize(self, report):
         self._tree = pt.tree_map(
             lambda report_leaf: jnp.zeros(
-                (self._n_steps,) + jnp.array(report_leaf).shape,
-                jnp.array(report_leaf).dtype,
+                (self._n_steps,) + jnp.shape(report_leaf),
+                jnp.result_type(report_leaf),
             ),
             report,
         )
+        self._path_index = _path_index(self._tree)
 
     def record(self, reports, step):
         if self._tree is None:
             self.initialize(reports)
-        self._tree = pt.tree_map_with_path(
-            lambda pth, trace, report_leaf: (
-                trace.at[step].set(report_leaf)
-                if jnp.array(report_leaf).shape == trace[step].shape
-                # else print(report_leaf.shape, trace.shape, step, trace[step].shape),
-                else exec(
-                    'raise ValueError("Report at path '
-                    + f"{pth} had shape {report_leaf.shape} when "
-                    "trace was initialized with shape"
-                    + f'{trace[step].shape}")'
-                )
-            ),
-            self._tree,
-            reports,
-        )
+        if isinstance(step, slice):
+            self._tree = pt.tree_map(
+                lambda trace, report_leaf: trace.at[step].set(report_leaf),
+                self._tree,
+                reports,
+            )
+        else:
+            self._tree = _record_step_fn()(self._tree, reports, step)
 
     def read(self):
         return self._tree
@@ -53,6 +51,9 @@ class ArrayTrace:
             else:
                 ax.set_xlabel(_keystr(path, plottable))
 
+    def leaf(self, path):
+        return _index(self._tree, path, self._path_index)
+
     def as_dict(self):
         return self._tree
 
@@ -62,6 +63,7 @@ class ArrayTrace:
     def copy(self):
         ret = ArrayTrace(self._n_steps)
         ret._tree = pt.tree_map(lambda arr: arr.copy(), self._tree)
+        ret._path_index = self._path_index
         return ret
 
     def __len__(self):
@@ -71,6 +73,37 @@ class ArrayTrace:
         return pt.tree_map(lambda arr: arr[step], self._tree)
 
 
+def _record_step(tree, reports, step):
+    """Write `reports` into `tree` at index `step` along the leading axis.
+
+    `step` is traced, so this compiles once per report structure."""
+
+    def update(path, trace, report_leaf):
+        report_leaf = jnp.asarray(report_leaf)
+        # shapes are static, so this check runs only while tracing
+        if report_leaf.shape != trace.shape[1:]:
+            raise ValueError(
+                f"Report at path {_keystr(path)} had shape "
+                f"{report_leaf.shape} when trace was initialized with shape "
+                f"{trace.shape[1:]}"
+            )
+        return lax.dynamic_update_index_in_dim(
+            trace, report_leaf.astype(trace.dtype), step, 0
+        )
+
+    return pt.tree_map_with_path(update, tree, reports)
+
+
+@functools.lru_cache(maxsize=None)
+def _record_step_fn():
+    """Jitted `_record_step` that updates trace buffers in place.
+
+    Built on first use so that importing this module does not initialize a JAX
+    backend. Buffer donation is not supported by the CPU backend."""
+    donate = () if jax.default_backend() == "cpu" else (0,)
+    return jax.jit(_record_step, donate_argnums=donate)
+
+
 def _single_key_repr(tree_key):
     if isinstance(tree_key, pt.DictKey):
         return tree_key.key
@@ -89,12 +122,18 @@ def _keystr(path, arr=None):
     return "/".join(str(_single_key_repr(k)) for k in path) + size_string
 
 
-def _index(tree, path):
+def _path_index(tree):
+    """Map each leaf path of `tree` to its position in the flattened leaves."""
     paths_vals, _ = pt.tree_flatten_with_path(tree)
-    for path, val in paths_vals:
-        if path == path:
-            return val
-    raise IndexError(f"No element {path} in {tree}")
+    return {path: i for i, (path, _) in enumerate(paths_vals)}
+
+
+def _index(tree, path, path_index=None):
+    if path_index is None:
+        path_index = _path_index(tree)
+    if path not in path_index:
+        raise IndexError(f"No element {path} in {tree}")
+    return pt.tree_leaves(tree)[path_index[path]]
 
 
 def _all_paths(tree):
@@ -97,6 +97,11 @@ class MorphModel(NamedTuple):
         [MorphModelParams, PytreeDataset, Integer[Array, "n_sessions"]],
         PytreeDataset,
     ]
+    to_canonical: Callable[[MorphModelParams, PytreeDataset], PytreeDataset]
+    from_canonical: Callable[
+        [MorphModelParams, PytreeDataset, Integer[Array, "n_sessions"]],
+        PytreeDataset,
+    ]
     plot_calibration: Callable[[Project, dict], Any]
 
 
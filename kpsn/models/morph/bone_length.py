@@ -19,6 +19,8 @@ import logging
 from .lowrank_affine import (
     reports,
     apply_bodies,
+    to_canonical,
+    from_canonical,
 )
 
 
@@ -251,5 +253,7 @@ model = MorphModel(
     init=init,
     reports=reports,
     apply_bodies=apply_bodies,
+    to_canonical=to_canonical,
+    from_canonical=from_canonical,
     plot_calibration=plot_calibration,
 )
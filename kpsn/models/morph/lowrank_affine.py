@@ -344,6 +344,26 @@ def mode_components(
     return coords, components, complement
 
 
+def to_canonical(params: LRAParams, observations: Dataset) -> Dataset:
+    """Map each session of a dataset to canonical pose space."""
+    return inverse_transform(params, observations)
+
+
+def from_canonical(
+    params: LRAParams,
+    poses: Dataset,
+    target_bodies: dict[Union[str, int], Union[str, int]],
+) -> Dataset:
+    """Map canonical poses to observation space, assigning each session the
+    body given in `target_bodies`."""
+    # form new dataset with new bodies assigned to each session
+    tgt_dataset = poses.update(
+        session_meta=poses.session_meta.update(session_bodies=target_bodies)
+    )
+    # map to observation space using the new assignment of bodies
+    return transform(params, tgt_dataset)
+
+
 def apply_bodies(
     params: LRAParams,
     observations: Dataset,
@@ -359,27 +379,8 @@ def apply_bodies(
         Dataset, sessions are indexed by integers not strings, so this is
         an array instead of a dictionary.)
     """
-    poses: Dataset = inverse_transform(params, observations)
-    # form new dataset with new bodies assigned to each session
-    tgt_dataset = poses.update(
-        session_meta=observations.session_meta.update(
-            session_bodies=target_bodies
-        )
-    )
-    # map to observation space using the new assignment of bodies
-    return transform(params, tgt_dataset)
-    # tgt_dataset = Dataset(
-    #     poses.data,
-    #     observations.slices,
-    #     target_bodies,
-    #     ref_session=observations.ref_session,
-    #     body_ids=new_body_ids,
-    #     session_ids=observations.stack_session_ids,
-    #     bodies_inv=tuple(
-    #         tuple(jnp.where(target_bodies == b)[0])
-    #         for b in range(observations.n_bodies)
-    #     ),
-    # )
+    poses: Dataset = to_canonical(params, observations)
+    return from_canonical(params, poses, target_bodies)
 
 
 model = MorphModel(
@@ -393,5 +394,7 @@ model = MorphModel(
     init=init,
     reports=reports,
     apply_bodies=apply_bodies,
+    to_canonical=to_canonical,
+    from_canonical=from_canonical,
     plot_calibration=plot_calibration,
 )
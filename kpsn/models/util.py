@@ -280,7 +280,8 @@ def reconst_errs(kpts_a, kpts_b, average=True):
 
 
 def _optional_pbar(iterable, flag):
-    if flag is False:
+    # any falsy flag (False, None, "") skips tqdm entirely
+    if not flag:
         return iterable
     if isinstance(flag, (str, int)) and not isinstance(flag, bool):
         return tqdm.tqdm(iterable, desc=str(flag))
@@ -6,7 +6,9 @@ For fitting with only a partial set of PCs, see scipy.sparse.linalg.svds
 
 from typing import NamedTuple, Tuple
 from jaxtyping import Float, Array
+from jax import lax
 import jax.numpy as jnp
+import jax
 import numpy as np
 
 
@@ -120,9 +122,95 @@ class CenteredPCA:
         return self._pcadata.coords(arr - self._center[..., None, :])
 
 
+def scatter_matrix(
+    data: Float[Array, "n_samples n_feats"],
+    center: Float[Array, "n_feats"] = None,
+    batch_size: int = None,
+    matmul_dtype=None,
+) -> Float[Array, "n_feats n_feats"]:
+    """
+    Scatter matrix of data about `center`, (X - center)^T (X - center).
+
+    Parameters:
+        center: array, optional
+            Point about which to compute the scatter. Defaults to the origin.
+        batch_size: int, optional
+            If given, accumulate the scatter matrix over batches of this many
+            samples so that no centered copy of the full data is formed.
+        matmul_dtype: dtype, optional
+            If given, e.g. `jnp.bfloat16`, centered data is cast to this dtype
+            for the matrix product, which still accumulates in the dtype of
+            `data`."""
+
+    n_feats = data.shape[-1]
+    if center is None:
+        center = jnp.zeros(n_feats, data.dtype)
+    return sum_over_batches(
+        lambda batch: _gram(batch - center[None], matmul_dtype),
+        data,
+        batch_size,
+    )
+
+
+def sum_over_batches(fn, data, batch_size: int = None):
+    """
+    Sum of `fn` applied to consecutive batches of samples (rows) of `data`.
+
+    Parameters:
+        fn: callable
+            Maps an array of shape (n, ...) to an array whose shape does not
+            depend on n.
+        batch_size: int, optional
+            Number of samples per batch. Only one batch is operated on at a
+            time. If not given, `fn` is applied to all of `data` at once."""
+
+    if batch_size is None:
+        return fn(data)
+    data = jnp.asarray(data)
+    n_full = data.shape[0] // batch_size
+    n_full_samples = n_full * batch_size
+
+    total = None
+    if n_full > 0:
+        # full batches are sliced out of `data` one at a time, without
+        # forming a reshaped or padded copy
+        def accumulate(acc, i):
+            batch = lax.dynamic_slice_in_dim(data, i * batch_size, batch_size)
+            return acc + fn(batch), None
+
+        out = jax.eval_shape(
+            fn,
+            jax.ShapeDtypeStruct((batch_size,) + data.shape[1:], data.dtype),
+        )
+        total, _ = lax.scan(
+            accumulate, jnp.zeros(out.shape, out.dtype), jnp.arange(n_full)
+        )
+    if n_full_samples < data.shape[0]:
+        remainder = fn(data[n_full_samples:])
+        total = remainder if total is None else total + remainder
+    return total
+
+
+def _gram(centered, matmul_dtype=None):
+    """X^T X, optionally multiplying in `matmul_dtype` with accumulation in the
+    dtype of `centered`."""
+    if matmul_dtype is None:
+        return centered.T @ centered
+    low = centered.astype(matmul_dtype)
+    return lax.dot_general(
+        low,
+        low,
+        (((0,), (0,)), ((), ())),
+        preferred_element_type=centered.dtype,
+    )
+
+
 def fit(
     data: Float[Array, "*#K n_samples n_feats"],
     sign_correction: str = None,
+    center: Float[Array, "n_feats"] = None,
+    batch_size: int = None,
+    matmul_dtype=None,
 ) -> PCAData:
     """
     Parameters:
@@ -130,15 +218,30 @@ def fit(
             Whether sample mean of the data is zero in all features.
             If it is not, then components will be given a canonical
             orientation (+/-) such that the mean of the data has positive
-            coordinates."""
+            coordinates.
+        center: array, optional
+            Point to treat as the origin of the data, e.g. its mean.
+        batch_size: int, optional
+            Accumulate the covariance over batches of samples of this size.
+            See `scatter_matrix`.
+        matmul_dtype: dtype, optional
+            Reduced precision in which to form the covariance. The
+            eigendecomposition is always performed at full precision. See
+            `scatter_matrix`."""
 
-    cov = data.T @ data
-    _, s2, vt = np.linalg.svd(cov)
+    cov = scatter_matrix(data, center, batch_size, matmul_dtype)
+    # cov is symmetric PSD, so its (cheaper) eigendecomposition gives the
+    # squared singular values of `data`; sort descending as in an SVD
+    s2, v = np.linalg.eigh(cov)
+    s2 = np.clip(s2[..., ::-1], 0, None)
+    vt = np.swapaxes(v[..., ::-1], -2, -1)
 
     if sign_correction is not None:
         if sign_correction == "mean":
             # coords for mean of data
             standard_vec = data.mean(axis=-2)
+            if center is not None:
+                standard_vec = standard_vec - center
         if sign_correction == "ones":
             standard_vec = jnp.ones(data.shape[:-2] + (data.shape[-1],))
         # standard_vec: (..., n_components)
@@ -159,9 +262,17 @@ def fit(
 def fit_with_center(
     data: Float[Array, "*#K n_samples n_feats"],
     sign_correction: str = None,
+    batch_size: int = None,
+    matmul_dtype=None,
 ) -> CenteredPCA:
     center = data.mean(axis=-2)
-    pcs = fit(data - center[..., None, :], sign_correction=sign_correction)
+    pcs = fit(
+        data,
+        sign_correction=sign_correction,
+        center=center,
+        batch_size=batch_size,
+        matmul_dtype=matmul_dtype,
+    )
     return CenteredPCA(center, pcs)
 
 
@@ -1,12 +1,29 @@
 
 from typing import Optional
+from functools import partial, lru_cache
 from jaxtyping import Array, Float
 import jax._src.random as prng
 PRNGKey = prng.KeyArray
 from tensorflow_probability.substrates import jax as tfp
-from jax import vmap
 from jax.scipy.linalg import solve_triangular
 import jax.numpy as jnp
+import numpy as np
+
+
+@lru_cache(maxsize=None)
+def _tri_diag_ix(n: int):
+    """
+    Host-side index arrays for (n, n) matrices, computed once per `n`:
+    lower-triangular, strictly lower-triangular, and diagonal indices, as
+    well as indices for flat-form cholesky `[log_diag | strict tril]`.
+    """
+    tril_ix = np.tril_indices(n)
+    strict_tril_ix = np.tril_indices(n, k = -1)
+    diag_ix = np.diag_indices(n)
+    chol_ix = tuple(
+        np.concatenate([d, t]) for d, t in zip(diag_ix, strict_tril_ix))
+    return tril_ix, strict_tril_ix, diag_ix, chol_ix
+
 
 def expand_tril(
     tril_values: Float[Array, "*#K n*(n+1)/2"],
@@ -17,7 +34,7 @@ def expand_tril(
     """
 
     tmp = jnp.zeros(tril_values.shape[:-1] + (n, n))
-    tril = jnp.tril_indices(n)
+    tril, _, _, _ = _tri_diag_ix(n)
     return tmp.at[..., tril[0], tril[1]].set(tril_values)
 
 
@@ -33,10 +50,10 @@ def expand_tril_cholesky(
     log_diag = cholesky[..., :n]
     tril = cholesky[..., n:]
     tmp = jnp.zeros(cholesky.shape[:-1] + (n, n))
-    tril_ix = jnp.tril_indices(n, k = -1)
-    diag_ix = jnp.diag_indices(n)
-    L = tmp.at[..., tril_ix[0], tril_ix[1]].set(tril)
-    L = L.at[..., diag_ix[0], diag_ix[1]].set(jnp.exp(log_diag))
+    _, _, _, chol_ix = _tri_diag_ix(n)
+    # diagonal and strictly lower entries scattered together
+    values = jnp.concatenate([jnp.exp(log_diag), tril], axis = -1)
+    L = tmp.at[..., chol_ix[0], chol_ix[1]].set(values)
     pd = L @ jnp.swapaxes(L, -2, -1)
     return pd
 
@@ -49,8 +66,7 @@ def extract_tril_cholesky(
 
     L = jnp.linalg.cholesky(A)
     n = L.shape[-1]
-    tril_ix = jnp.tril_indices(n, k = -1)
-    diag_ix = jnp.diag_indices(n)
+    _, tril_ix, diag_ix, _ = _tri_diag_ix(n)
     tril = L[..., tril_ix[0], tril_ix[1]]
     log_diag = jnp.log(L[..., diag_ix[0], diag_ix[1]])
     return jnp.concatenate([log_diag, tril], axis = -1)
@@ -95,9 +111,13 @@ class InverseWishart(tfd.TransformedDistribution):
         # Compute the Cholesky of the inverse scale to parameterize a
         # Wishart distribution
         dim = scale.shape[-1]
-        eye = jnp.broadcast_to(jnp.eye(dim), scale.shape)
         cho_scale = jnp.linalg.cholesky(scale)
-        inv_scale_tril = solve_triangular(cho_scale, eye, lower=True)
+        # vectorize maps over batch dimensions of cho_scale only, so a single
+        # identity is shared rather than broadcast to the batch shape
+        inv_scale_tril = jnp.vectorize(
+            partial(solve_triangular, lower=True),
+            signature="(n,n),(n,m)->(n,m)",
+        )(cho_scale, jnp.eye(dim))
 
         # model p(y) as y = g(x) and p(x)
         # x ~ WishartTril
@@ -143,21 +163,18 @@ class InverseWishart(tfd.TransformedDistribution):
         """
 
         def _single_variance(df, scale):
-            assert scale.ndim == 2
-            assert df.shape == scale.shape
             dim = scale.shape[-1]
             diag = jnp.diag(scale)
-            rows = jnp.arange(dim)[:, None].repeat(3, axis=1)
-            cols = jnp.arange(dim)[None, :].repeat(3, axis=0)
-            numer = (df - dim + 1) * scale**2 + (df - dim - 1) * diag[rows] * diag[cols]
+            numer = (df - dim + 1) * scale**2 + (df - dim - 1) * jnp.outer(diag, diag)
             denom = (df - dim) * (df - dim - 1)**2 * (df - dim - 3)
             return numer / denom
 
-        dfs, scales = jnp.broadcast_arrays(jnp.array(self.df)[..., None, None], self.scale)
-        if scales.ndim == 2:
-            return _single_variance(dfs, scales)
-        else:
-            return vmap(_single_variance)(dfs, scales)
+        # vectorize broadcasts scalar df against batches of scale matrices
+        # without materializing df at the shape of scale
+        return jnp.vectorize(
+            _single_variance,
+            signature="(),(n,n)->(n,n)",
+        )(jnp.asarray(self.df), self.scale)
 
 
 def sq_mahalanobis(
@@ -182,8 +199,16 @@ def sq_mahalanobis(
     assert cov is not None or cov_inv is not None, (
         "One of `cov` or `cov_inv` required.")
     if cov_inv is None:
-        cov_inv = jnp.linalg.inv(cov)
-    return (diff[..., None, :] @ cov_inv @ diff[..., :, None])[..., 0, 0]
+        # whiten by the cholesky factor rather than forming an inverse
+        # vectorize maps over batch dimensions without materializing the
+        # factor at the broadcast shape, as in InverseWishart
+        L = jnp.linalg.cholesky(cov)
+        z = jnp.vectorize(
+            partial(solve_triangular, lower=True),
+            signature="(n,n),(n)->(n)",
+        )(L, diff)
+        return (z * z).sum(-1)
+    return jnp.einsum("...i,...ij,...j->...", diff, cov_inv, diff)
 
 
 def broadcast_batch(arr, batch_shape):
@@ -16,22 +16,19 @@ def init_nb(
 
 
 def set_style(style):
-    try:
-        plt.style.use(style)
-        _style = color_sets[style]
-        colorset.active = _style
-    except:
-        try:
-            plt.style.use(
-                Path(__file__).parent / "stylesheets" / f"{style}.mplstyle"
-            )
-            _style = color_sets[style]
-            colorset.active = _style
-        except:
-            logging.warn(
-                "[init_nb] No matplotlib style `{style}` found, resorting to `default`."
-            )
-            style = "default"
-            plt.style.use(style)
-            _style = color_sets[style]
-            colorset.active = _style
\ No newline at end of file
+    style_path = Path(__file__).parent / "stylesheets" / f"{style}.mplstyle"
+    # matplotlib's "default" is valid but not listed in `available`
+    if style == "default" or style in plt.style.available:
+        mpl_style = style
+    elif style_path.exists():
+        mpl_style = style_path
+    else:
+        mpl_style = None
+    if mpl_style is None or style not in color_sets:
+        logging.warning(
+            f"[init_nb] No matplotlib style or color set `{style}` found, "
+            "resorting to `default`."
+        )
+        style = mpl_style = "default"
+    plt.style.use(mpl_style)
+    colorset.active = color_sets[style]